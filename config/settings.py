@@ -1,11 +1,48 @@
 """
 Configuration management for the document converter.
 """
+import copy
+import functools
 import os
 import yaml
 from pathlib import Path
 from typing import Dict, Any, List
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, caching the result by path and modification time.
+
+    Args:
+        path: Path to YAML file
+        mtime_ns: Modification time of the file, used as part of the cache key
+
+    Returns:
+        Parsed YAML content (shared; callers must copy before mutating)
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def _load_yaml(path: str) -> Dict[str, Any]:
+    """
+    Load a YAML file through the parse cache.
+
+    Args:
+        path: Path to YAML file
+
+    Returns:
+        Private copy of the parsed YAML content
+    """
+    path = str(path)
+    return copy.deepcopy(_load_yaml_cached(path, os.stat(path).st_mtime_ns))
+
 
 class Config:
     """Configuration manager for the document converter."""
@@ -18,6 +55,7 @@ class Config:
             config_path: Path to custom config file. If None, uses default.
         """
         self.config_data = self._load_config(config_path)
+        self._apply_settings()
         self._validate_config()
 
     def _load_config(self, config_path: str = None) -> Dict[str, Any]:
@@ -32,22 +70,21 @@ class Config:
         """
         # Load default config
         default_config_path = Path(__file__).parent / "default_config.yaml"
-        with open(default_config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(default_config_path)
 
         # Override with custom config if provided
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                custom_config = yaml.safe_load(f)
-                config.update(custom_config)
+            custom_config = _load_yaml(config_path)
+            config.update(custom_config)
 
         return config
 
     def _validate_config(self):
         """Validate configuration values."""
-        # Validate batch size
-        if self.batch_size < 1 or self.batch_size > 50:
-            raise ValueError("batch_size must be between 1 and 50")
+        # Validate batch size; values far above the CPU count only draw a
+        # warning from BatchProcessor, since 0 can resolve to any CPU count
+        if self.batch_size < 0:
+            raise ValueError("batch_size must be at least 0 (CPU count)")
 
         # Validate memory limit
         if self.max_memory_gb < 1:
@@ -58,58 +95,23 @@ class Config:
         os.makedirs(self.output_folder, exist_ok=True)
         os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
 
-    @property
-    def input_folder(self) -> str:
-        """Get input folder path."""
-        return self.config_data.get('input_folder', './input')
-
-    @property
-    def output_folder(self) -> str:
-        """Get output folder path."""
-        return self.config_data.get('output_folder', './output')
-
-    @property
-    def batch_size(self) -> int:
-        """Get batch size for parallel processing."""
-        return self.config_data.get('batch_size', 10)
-
-    @property
-    def max_memory_gb(self) -> float:
-        """Get maximum memory usage in GB."""
-        return self.config_data.get('max_memory_gb', 10)
-
-    @property
-    def log_level(self) -> str:
-        """Get logging level."""
-        return self.config_data.get('log_level', 'INFO')
-
-    @property
-    def log_file(self) -> str:
-        """Get log file path."""
-        return self.config_data.get('log_file', './logs/converter.log')
-
-    @property
-    def supported_formats(self) -> List[str]:
-        """Get list of supported file formats."""
-        return self.config_data.get('supported_formats', [
+    def _apply_settings(self):
+        """Materialize configuration values as instance attributes."""
+        data = self.config_data
+        self.input_folder: str = data.get('input_folder', './input')
+        self.output_folder: str = data.get('output_folder', './output')
+        self.batch_size: int = data.get('batch_size', 10)
+        self.max_memory_gb: float = data.get('max_memory_gb', 10)
+        self.log_level: str = data.get('log_level', 'INFO')
+        self.log_file: str = data.get('log_file', './logs/converter.log')
+        self.supported_formats: List[str] = data.get('supported_formats', [
             'pdf', 'docx', 'xlsx', 'pptx', 'html', 'htm',
             'md', 'markdown', 'epub', 'mobi'
         ])
-
-    @property
-    def preserve_structure(self) -> bool:
-        """Get whether to preserve document structure."""
-        return self.config_data.get('preserve_structure', True)
-
-    @property
-    def skip_on_error(self) -> bool:
-        """Get whether to skip failed conversions."""
-        return self.config_data.get('skip_on_error', True)
-
-    @property
-    def overwrite_existing(self) -> bool:
-        """Get whether to overwrite existing output files."""
-        return self.config_data.get('overwrite_existing', False)
+        self.preserve_structure: bool = data.get('preserve_structure', True)
+        self.skip_on_error: bool = data.get('skip_on_error', True)
+        self.overwrite_existing: bool = data.get('overwrite_existing', False)
+        self.use_processes: bool = data.get('use_processes', True)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -124,6 +126,17 @@ class Config:
         """
         return self.config_data.get(key, default)
 
+    def set(self, key: str, value: Any):
+        """
+        Set configuration value by key.
+
+        Args:
+            key: Configuration key
+            value: New value
+        """
+        self.config_data[key] = value
+        self._apply_settings()
+
     def __repr__(self) -> str:
         """String representation of config."""
         return f"Config(input={self.input_folder}, output={self.output_folder}, batch_size={self.batch_size})"
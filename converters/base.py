@@ -2,10 +2,60 @@
 Base converter class for document conversion.
 """
 from abc import ABC, abstractmethod
+import os
+import stat
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
 import logging
 
+# Output files are written through a 1 MiB buffer so streamed chunks are flushed in large blocks
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Output folders already created by this process; many documents usually
+# share a folder, so each one is only created once
+_ensured_dirs = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: str):
+    """
+    Create a folder (and parents) unless this process already did.
+
+    Args:
+        path: Path to folder
+    """
+    if path in _ensured_dirs:
+        return
+    with _ensured_dirs_lock:
+        if path not in _ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            _ensured_dirs.add(path)
+
+
+def _open_output(output_path: str):
+    """
+    Open an output file for writing, creating its folder if needed.
+
+    A cached folder may have been removed since it was created; in that
+    case it is dropped from the cache, created again and the open retried.
+
+    Args:
+        output_path: Path to output file
+
+    Returns:
+        Open text file
+    """
+    folder = os.path.dirname(output_path) or '.'
+    _ensure_dir(folder)
+    try:
+        return open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+    except FileNotFoundError:
+        with _ensured_dirs_lock:
+            _ensured_dirs.discard(folder)
+        _ensure_dir(folder)
+        return open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+
 
 class BaseConverter(ABC):
     """Abstract base class for document converters."""
@@ -57,42 +107,151 @@ class BaseConverter(ABC):
         Returns:
             True if valid, False otherwise
         """
-        path = Path(input_path)
-        if not path.exists():
+        return self._stat_input(input_path) is not None
+
+    def _stat_input(self, input_path: str) -> Optional[os.stat_result]:
+        """
+        Validate input file exists and return its stat result.
+
+        Args:
+            input_path: Path to input file
+
+        Returns:
+            Stat result if valid, None otherwise
+        """
+        # Single stat() covers both the existence and regular-file checks
+        try:
+            st = os.stat(input_path)
+        except (OSError, ValueError):
             self.logger.error(f"Input file does not exist: {input_path}")
-            return False
+            return None
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             self.logger.error(f"Input path is not a file: {input_path}")
-            return False
+            return None
+
+        return st
 
-        return True
+    @staticmethod
+    def _read_text(input_path: str) -> str:
+        """
+        Read a UTF-8 text file in a single read.
+
+        The file is read as bytes and decoded once, instead of through the
+        incremental decoder of a text-mode file. Invalid bytes are dropped
+        and newlines are normalized as in text mode.
+
+        Args:
+            input_path: Path to text file
 
-    def _write_output(self, text: str, output_path: str) -> bool:
+        Returns:
+            File content
+        """
+        with open(input_path, 'rb') as f:
+            raw = f.read()
+
+        text = raw.decode('utf-8', errors='ignore')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from document as a stream of chunks.
+
+        Converters that can produce output incrementally override this so
+        the full document never has to be held in memory as one string.
+
+        Args:
+            input_path: Path to input document
+
+        Yields:
+            Chunks of extracted text
+        """
+        yield self._extract_text(input_path)
+
+    @staticmethod
+    def _strip_chunks(chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Strip leading and trailing whitespace from a stream of chunks.
+
+        Equivalent to ``''.join(chunks).strip()`` without joining the chunks.
+
+        Args:
+            chunks: Text chunks
+
+        Yields:
+            Chunks with surrounding whitespace of the whole stream removed
+        """
+        started = False
+        pending = []
+
+        for chunk in chunks:
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+
+            stripped = chunk.rstrip()
+            if not stripped:
+                # Whitespace-only chunk; only emit it if more text follows
+                pending.append(chunk)
+                continue
+
+            if pending:
+                yield ''.join(pending)
+                pending.clear()
+
+            yield stripped
+            if len(stripped) < len(chunk):
+                pending.append(chunk[len(stripped):])
+
+    def _write_output(self, text: Union[str, Iterable[str]], output_path: str) -> bool:
         """
         Write text to output file.
 
+        A string is written as-is. An iterable of chunks is streamed to the
+        file with surrounding whitespace stripped; if it yields no text,
+        nothing is written and False is returned.
+
         Args:
-            text: Text content to write
+            text: Text content to write, as a string or iterable of chunks
             output_path: Path to output file
 
         Returns:
             True if successful, False otherwise
         """
-        try:
-            output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(text, str):
+            chunks = iter((text,))
+        else:
+            chunks = self._strip_chunks(text)
+
+        # Pull the first chunk before touching the output file so empty
+        # documents don't leave an empty file behind
+        first = next(chunks, None)
+        if first is None:
+            self.logger.debug(f"No text extracted, skipping output: {output_path}")
+            return False
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+        try:
+            with _open_output(output_path) as f:
+                f.write(first)
+                f.writelines(chunks)
 
             self.logger.debug(f"Successfully wrote output to: {output_path}")
             return True
 
-        except Exception as e:
+        except OSError as e:
             self.logger.error(f"Failed to write output to {output_path}: {str(e)}")
+            Path(output_path).unlink(missing_ok=True)
             return False
 
+        except Exception:
+            # Extraction failed mid-stream; don't leave a truncated file behind
+            Path(output_path).unlink(missing_ok=True)
+            raise
+
     def safe_convert(self, input_path: str, output_path: str) -> tuple[bool, Optional[str]]:
         """
         Safely convert document with error handling.
@@ -105,9 +264,15 @@ class BaseConverter(ABC):
             Tuple of (success: bool, error_message: Optional[str])
         """
         try:
-            if not self._validate_input(input_path):
+            st = self._stat_input(input_path)
+            if st is None:
                 return False, "Invalid input file"
 
+            # Nothing to extract; skip opening and parsing the file
+            if st.st_size == 0:
+                self.logger.warning(f"Input file is empty: {input_path}")
+                return False, "Empty input file"
+
             success = self.convert(input_path, output_path)
             if success:
                 return True, None
@@ -1,9 +1,66 @@
 """
 DOCX to text converter.
 """
+import re
+from typing import Iterator
 from docx import Document
+from docx.oxml.ns import qn
 from .base import BaseConverter
 
+# WordprocessingML tags, read straight from the body XML instead of through
+# python-docx's per-paragraph wrapper objects
+_W_P = qn('w:p')
+_W_R = qn('w:r')
+_W_HYPERLINK = qn('w:hyperlink')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
+_W_TYPE = qn('w:type')
+_W_VAL = qn('w:val')
+_PSTYLE_PATH = f"{qn('w:pPr')}/{qn('w:pStyle')}"
+
+# Run children with a fixed text equivalent, as in python-docx's CT_R.text
+_RUN_CHARS = {
+    qn('w:tab'): '\t',
+    qn('w:ptab'): '\t',
+    qn('w:cr'): '\n',
+    qn('w:noBreakHyphen'): '-',
+}
+_RUN_TEXT_TAGS = (_W_T, _W_BR, *_RUN_CHARS)
+
+# "Heading 2" -> level 2; other "Heading..." styles fall back to level 2
+_HEADING_RE = re.compile(r'^Heading(?: (\d+)$)?')
+
+
+def _paragraph_text(p) -> str:
+    """
+    Get the text of a <w:p> element.
+
+    Mirrors python-docx's Paragraph.text: only the paragraph's own runs
+    (directly or inside hyperlinks) are read, so text boxes and other
+    nested content are skipped. Tabs become '\t', line breaks become '\n'
+    and non-breaking hyphens become '-'; page and column breaks are dropped.
+
+    Args:
+        p: lxml <w:p> element
+
+    Returns:
+        Paragraph text
+    """
+    parts = []
+    for child in p.iterchildren(_W_R, _W_HYPERLINK):
+        runs = (child,) if child.tag == _W_R else child.iterchildren(_W_R)
+        for run in runs:
+            for node in run.iterchildren(*_RUN_TEXT_TAGS):
+                tag = node.tag
+                if tag == _W_T:
+                    parts.append(node.text or '')
+                elif tag == _W_BR:
+                    if node.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                        parts.append('\n')
+                else:
+                    parts.append(_RUN_CHARS[tag])
+    return ''.join(parts)
+
 
 class DOCXConverter(BaseConverter):
     """Converter for DOCX documents."""
@@ -20,10 +77,7 @@ class DOCXConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting DOCX {input_path}: {str(e)}")
             return False
@@ -38,33 +92,46 @@ class DOCXConverter(BaseConverter):
         Returns:
             Extracted text
         """
+        return ''.join(self._iter_text(input_path)).strip()
+
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from DOCX as a stream of chunks.
+
+        Args:
+            input_path: Path to DOCX file
+
+        Yields:
+            Chunks of extracted text
+        """
         doc = Document(input_path)
-        text_parts = []
+        # Paragraphs reference styles by id; resolve names once per document
+        style_names = {style.style_id: style.name for style in doc.styles}
 
-        for paragraph in doc.paragraphs:
-            text = paragraph.text.strip()
+        # Top-level body paragraphs only, same as doc.paragraphs
+        for p in doc.element.body.iterchildren(_W_P):
+            text = _paragraph_text(p).strip()
 
             if not text:
                 continue
 
             if self.preserve_structure:
                 # Detect headings by style
-                if paragraph.style.name.startswith('Heading'):
-                    level = paragraph.style.name.replace('Heading ', '')
-                    if level.isdigit():
-                        prefix = '#' * int(level)
-                        text_parts.append(f"\n{prefix} {text}\n")
-                    else:
-                        text_parts.append(f"\n## {text}\n")
+                style = p.find(_PSTYLE_PATH)
+                style_name = style_names.get(style.get(_W_VAL), '') if style is not None else ''
+                match = _HEADING_RE.match(style_name)
+                if match:
+                    level = int(match.group(1)) if match.group(1) else 2
+                    yield f"\n{'#' * level} {text}\n"
                 else:
-                    text_parts.append(f"{text}\n")
+                    yield f"{text}\n"
             else:
-                text_parts.append(f"{text}\n")
+                yield f"{text}\n"
 
         # Extract text from tables
         for table in doc.tables:
             if self.preserve_structure:
-                text_parts.append("\n[TABLE]\n")
+                yield "\n[TABLE]\n"
 
             for row in table.rows:
                 row_text = []
@@ -75,14 +142,12 @@ class DOCXConverter(BaseConverter):
 
                 if row_text:
                     if self.preserve_structure:
-                        text_parts.append(" | ".join(row_text) + "\n")
+                        yield " | ".join(row_text) + "\n"
                     else:
-                        text_parts.append(" ".join(row_text) + "\n")
+                        yield " ".join(row_text) + "\n"
 
             if self.preserve_structure:
-                text_parts.append("[/TABLE]\n\n")
-
-        return ''.join(text_parts).strip()
+                yield "[/TABLE]\n\n"
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
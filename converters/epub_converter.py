@@ -1,11 +1,16 @@
 """
 EPUB to text converter.
 """
+from typing import Iterator
 import ebooklib
 from ebooklib import epub
 from bs4 import BeautifulSoup
+from lxml import etree
 from .base import BaseConverter
 
+# Chapter elements rendered in structured mode
+_STRUCTURE_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p')
+
 
 class EPUBConverter(BaseConverter):
     """Converter for EPUB documents."""
@@ -22,10 +27,7 @@ class EPUBConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting EPUB {input_path}: {str(e)}")
             return False
@@ -40,50 +42,85 @@ class EPUBConverter(BaseConverter):
         Returns:
             Extracted text
         """
+        return ''.join(self._iter_text(input_path)).strip()
+
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from EPUB as a stream of chunks.
+
+        Args:
+            input_path: Path to EPUB file
+
+        Yields:
+            Chunks of extracted text
+        """
         book = epub.read_epub(input_path)
-        text_parts = []
 
         # Get all document items (chapters)
-        for item in book.get_items():
-            if item.get_type() == ebooklib.ITEM_DOCUMENT:
-                try:
-                    # Get HTML content
-                    content = item.get_content()
-                    soup = BeautifulSoup(content, 'html.parser')
+        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
+            try:
+                # Get HTML content
+                content = item.get_content()
+
+                if self.preserve_structure:
+                    yield from self._iter_chapter(content)
+                else:
+                    soup = BeautifulSoup(content, 'lxml')
 
                     # Remove script and style elements
                     for script in soup(["script", "style"]):
                         script.decompose()
 
-                    if self.preserve_structure:
-                        # Add chapter separator
-                        text_parts.append(f"\n{'='*60}\n")
-
-                        # Try to get chapter title
-                        title = soup.find(['h1', 'h2', 'h3'])
-                        if title:
-                            text_parts.append(f"{title.get_text().strip()}\n")
-                            text_parts.append(f"{'='*60}\n\n")
-
-                        # Extract structured text
-                        for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']):
-                            text = element.get_text().strip()
-                            if text:
-                                if element.name.startswith('h'):
-                                    level = int(element.name[1])
-                                    text_parts.append(f"\n{'#' * level} {text}\n\n")
-                                else:
-                                    text_parts.append(f"{text}\n\n")
-                    else:
-                        # Simple text extraction
-                        text = soup.get_text(separator='\n', strip=True)
-                        text_parts.append(text + "\n\n")
-
-                except Exception as e:
-                    self.logger.warning(f"Error processing EPUB item: {str(e)}")
-                    continue
-
-        return ''.join(text_parts).strip()
+                    # Simple text extraction
+                    text = soup.get_text(separator='\n', strip=True)
+                    yield text + "\n\n"
+
+                    # bs4 trees are reference cycles; break them so each
+                    # chapter is freed before the next one is parsed
+                    soup.decompose()
+
+            except Exception as e:
+                self.logger.warning(f"Error processing EPUB item: {str(e)}")
+                continue
+
+    def _iter_chapter(self, content: bytes) -> Iterator[str]:
+        """
+        Extract structured text from one chapter.
+
+        Walks the lxml tree directly instead of building BeautifulSoup
+        wrappers for every element.
+
+        Args:
+            content: Chapter HTML content
+
+        Yields:
+            Chunks of extracted text
+        """
+        # Add chapter separator
+        yield f"\n{'='*60}\n"
+
+        tree = etree.HTML(content)
+        if tree is None:
+            return
+
+        # Remove script and style elements, keeping the text that follows them
+        etree.strip_elements(tree, 'script', 'style', with_tail=False)
+
+        # Try to get chapter title
+        title = next(tree.iter('h1', 'h2', 'h3'), None)
+        if title is not None:
+            yield f"{''.join(title.itertext()).strip()}\n"
+            yield f"{'='*60}\n\n"
+
+        # Extract structured text
+        for element in tree.iter(*_STRUCTURE_TAGS):
+            text = ''.join(element.itertext()).strip()
+            if text:
+                if element.tag.startswith('h'):
+                    level = int(element.tag[1])
+                    yield f"\n{'#' * level} {text}\n\n"
+                else:
+                    yield f"{text}\n\n"
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
@@ -1,40 +1,81 @@
 """
 Converter factory for creating appropriate converters based on file type.
 """
-from pathlib import Path
-from typing import Optional
+import importlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
 from .base import BaseConverter
-from .pdf_converter import PDFConverter
-from .docx_converter import DOCXConverter
-from .xlsx_converter import XLSXConverter
-from .pptx_converter import PPTXConverter
-from .html_converter import HTMLConverter
-from .markdown_converter import MarkdownConverter
-from .epub_converter import EPUBConverter
-from .mobi_converter import MOBIConverter
-from .vtt_converter import VTTConverter
-from .srt_converter import SRTConverter
+
+
+def _convert_one(input_path: str, output_path: str, preserve_structure: bool) -> Tuple[bool, Optional[str]]:
+    """
+    Convert a single document in a worker.
+
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+
+    Args:
+        input_path: Path to input document
+        output_path: Path to output text file
+        preserve_structure: Whether to preserve document structure
+
+    Returns:
+        Tuple of (success: bool, error_message: Optional[str])
+    """
+    try:
+        converter = ConverterFactory.get_shared_converter(input_path, preserve_structure=preserve_structure)
+        if not converter:
+            return False, f"No converter found for {input_path}"
+        return converter.safe_convert(input_path, output_path)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {str(e)}"
 
 
 class ConverterFactory:
     """Factory for creating document converters."""
 
-    # Map file extensions to converter classes
+    # Map file extensions to converter classes. Built-in converters are given
+    # as (module, class name) and imported on first use, so a run only pays
+    # the import cost of the backends it actually needs.
     CONVERTER_MAP = {
-        '.pdf': PDFConverter,
-        '.docx': DOCXConverter,
-        '.xlsx': XLSXConverter,
-        '.pptx': PPTXConverter,
-        '.html': HTMLConverter,
-        '.htm': HTMLConverter,
-        '.md': MarkdownConverter,
-        '.markdown': MarkdownConverter,
-        '.epub': EPUBConverter,
-        '.mobi': MOBIConverter,
-        '.vtt': VTTConverter,
-        '.srt': SRTConverter,
+        '.pdf': ('.pdf_converter', 'PDFConverter'),
+        '.docx': ('.docx_converter', 'DOCXConverter'),
+        '.xlsx': ('.xlsx_converter', 'XLSXConverter'),
+        '.pptx': ('.pptx_converter', 'PPTXConverter'),
+        '.html': ('.html_converter', 'HTMLConverter'),
+        '.htm': ('.html_converter', 'HTMLConverter'),
+        '.md': ('.markdown_converter', 'MarkdownConverter'),
+        '.markdown': ('.markdown_converter', 'MarkdownConverter'),
+        '.epub': ('.epub_converter', 'EPUBConverter'),
+        '.mobi': ('.mobi_converter', 'MOBIConverter'),
+        '.vtt': ('.vtt_converter', 'VTTConverter'),
+        '.srt': ('.srt_converter', 'SRTConverter'),
     }
 
+    # Converters keep no per-file state, so one instance per
+    # (extension, preserve_structure) can serve every file in a process
+    _shared_converters: Dict[Tuple[str, bool], BaseConverter] = {}
+
+    @classmethod
+    def _get_converter_class(cls, extension: str) -> Optional[Type[BaseConverter]]:
+        """
+        Resolve the converter class for an extension, importing it if needed.
+
+        Args:
+            extension: Lowercase file extension including the dot
+
+        Returns:
+            Converter class or None if format not supported
+        """
+        converter_class = cls.CONVERTER_MAP.get(extension)
+        if isinstance(converter_class, tuple):
+            module_name, class_name = converter_class
+            module = importlib.import_module(module_name, __package__)
+            converter_class = getattr(module, class_name)
+            cls.CONVERTER_MAP[extension] = converter_class
+        return converter_class
+
     @classmethod
     def get_converter(cls, file_path: str, preserve_structure: bool = True) -> Optional[BaseConverter]:
         """
@@ -47,14 +88,37 @@ class ConverterFactory:
         Returns:
             Converter instance or None if format not supported
         """
-        extension = Path(file_path).suffix.lower()
+        extension = os.path.splitext(file_path)[1].lower()
 
-        converter_class = cls.CONVERTER_MAP.get(extension)
+        converter_class = cls._get_converter_class(extension)
         if converter_class:
             return converter_class(preserve_structure=preserve_structure)
 
         return None
 
+    @classmethod
+    def get_shared_converter(cls, file_path: str, preserve_structure: bool = True) -> Optional[BaseConverter]:
+        """
+        Get a reusable converter for file type.
+
+        Args:
+            file_path: Path to file
+            preserve_structure: Whether to preserve document structure
+
+        Returns:
+            Converter instance shared with other callers, or None if format not supported
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        key = (extension, preserve_structure)
+
+        converter = cls._shared_converters.get(key)
+        if converter is None:
+            converter = cls.get_converter(file_path, preserve_structure=preserve_structure)
+            if converter:
+                cls._shared_converters[key] = converter
+
+        return converter
+
     @classmethod
     def is_supported(cls, file_path: str) -> bool:
         """
@@ -66,7 +130,7 @@ class ConverterFactory:
         Returns:
             True if supported, False otherwise
         """
-        extension = Path(file_path).suffix.lower()
+        extension = os.path.splitext(file_path)[1].lower()
         return extension in cls.CONVERTER_MAP
 
     @classmethod
@@ -78,3 +142,53 @@ class ConverterFactory:
             List of supported extensions
         """
         return list(cls.CONVERTER_MAP.keys())
+
+    @classmethod
+    def convert_many(
+        cls,
+        pairs: List[Tuple[str, str]],
+        max_workers: int,
+        preserve_structure: bool = True,
+        use_processes: bool = True,
+        initializer: Optional[Callable] = None,
+        initargs: tuple = ()
+    ) -> Iterator[Tuple[bool, Optional[str]]]:
+        """
+        Convert many documents in parallel.
+
+        Worker processes are used by default, since parsing is CPU-bound
+        Python and threads would be held back by the GIL. Tasks are handed
+        to the workers in chunks to cut per-document IPC overhead.
+
+        Args:
+            pairs: List of (input_path, output_path) tuples
+            max_workers: Number of workers
+            preserve_structure: Whether to preserve document structure
+            use_processes: Whether to use worker processes (threads otherwise)
+            initializer: Callable run at the start of each worker process
+            initargs: Arguments for initializer
+
+        Yields:
+            (success, error_message) tuples in the same order as pairs
+        """
+        if not pairs:
+            return
+
+        if use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=initializer,
+                initargs=initargs
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        inputs = [inp for inp, _ in pairs]
+        outputs = [out for _, out in pairs]
+        chunksize = max(1, len(pairs) // (max_workers * 4))
+
+        with executor:
+            yield from executor.map(
+                _convert_one, inputs, outputs, repeat(preserve_structure),
+                chunksize=chunksize
+            )
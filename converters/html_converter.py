@@ -1,9 +1,16 @@
 """
 HTML to text converter.
 """
-from bs4 import BeautifulSoup
+import io
+import re
+from bs4 import BeautifulSoup, SoupStrainer
 from .base import BaseConverter
 
+# Tags emitted when preserving structure; everything else is skipped at parse time
+_STRUCTURE_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'div', 'span', 'td', 'th']
+_STRAINER = SoupStrainer(_STRUCTURE_TAGS)
+_MULTI_NL = re.compile(r'\n{3,}')
+
 
 class HTMLConverter(BaseConverter):
     """Converter for HTML documents."""
@@ -38,20 +45,20 @@ class HTMLConverter(BaseConverter):
         Returns:
             Extracted text
         """
-        with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-            html_content = f.read()
+        html_content = self._read_text(input_path)
 
-        soup = BeautifulSoup(html_content, 'lxml')
+        parse_only = _STRAINER if self.preserve_structure else None
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=parse_only)
 
         # Remove script and style elements
         for script in soup(["script", "style", "meta", "link"]):
             script.decompose()
 
-        text_parts = []
+        buf = io.StringIO()
 
         if self.preserve_structure:
             # Process elements with structure preservation
-            for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'div', 'span', 'td', 'th']):
+            for element in soup.find_all(_STRUCTURE_TAGS):
                 text = element.get_text().strip()
                 if not text:
                     continue
@@ -61,28 +68,27 @@ class HTMLConverter(BaseConverter):
                 # Handle headings
                 if tag_name.startswith('h'):
                     level = int(tag_name[1])
-                    text_parts.append(f"\n{'#' * level} {text}\n")
+                    buf.write(f"\n{'#' * level} {text}\n")
                 # Handle list items
                 elif tag_name == 'li':
-                    text_parts.append(f"• {text}\n")
+                    buf.write(f"• {text}\n")
                 # Handle table cells
                 elif tag_name in ['td', 'th']:
-                    text_parts.append(f"{text} | ")
+                    buf.write(f"{text} | ")
                 # Handle paragraphs and divs
                 elif tag_name in ['p', 'div']:
-                    text_parts.append(f"{text}\n\n")
+                    buf.write(f"{text}\n\n")
                 else:
-                    text_parts.append(f"{text}\n")
+                    buf.write(f"{text}\n")
         else:
             # Simple text extraction
             text = soup.get_text(separator='\n', strip=True)
-            text_parts.append(text)
+            buf.write(text)
 
         # Clean up multiple newlines
-        result = ''.join(text_parts)
+        result = buf.getvalue()
         # Replace multiple newlines with maximum of 2
-        while '\n\n\n' in result:
-            result = result.replace('\n\n\n', '\n\n')
+        result = _MULTI_NL.sub('\n\n', result)
 
         return result.strip()
 
@@ -1,10 +1,28 @@
 """
 Markdown to text converter.
 """
+import html
+import re
 import markdown
-from bs4 import BeautifulSoup
 from .base import BaseConverter
 
+# Splits rendered HTML into the text between tags. As in html.parser, a
+# '<' only opens a tag when a name, '/', '!' or '?' follows, and tags may
+# contain quoted attribute values with '>' in them. Comments and whole <script>/<style>/
+# <template> elements (raw HTML passed through by markdown) are matched as
+# single separators so their contents are dropped, while CDATA sections are
+# kept as literal text. The first group captures the CDATA text and the
+# second the element name, so items of the split come in threes: text,
+# CDATA text, element name.
+_TAG = r"""(?:[^>"']|"[^"]*"|'[^']*')*>"""
+_SPLIT_RE = re.compile(
+    r'<!--.*?(?:-->|\Z)'
+    r'|<!\[CDATA\[(.*?)(?:\]\]>|\Z)'
+    r'|<(script|style|template)\b' + _TAG + r'.*?(?:</\2\s*>|\Z)'
+    r'|<[a-zA-Z/!?]' + _TAG,
+    re.IGNORECASE | re.DOTALL
+)
+
 
 class MarkdownConverter(BaseConverter):
     """Converter for Markdown documents."""
@@ -39,17 +57,23 @@ class MarkdownConverter(BaseConverter):
         Returns:
             Extracted text
         """
-        with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-            md_content = f.read()
+        md_content = self._read_text(input_path)
 
         if self.preserve_structure:
             # Keep markdown as-is (it's already text with structure)
             return md_content.strip()
         else:
-            # Convert to HTML then extract plain text
-            html = markdown.markdown(md_content)
-            soup = BeautifulSoup(html, 'html.parser')
-            return soup.get_text(separator='\n', strip=True)
+            # Convert to HTML then strip tags; markdown's output is
+            # well-formed, so no DOM is needed. Like get_text(), comments and
+            # script/style/template contents are left out and CDATA text is
+            # kept without unescaping.
+            parts = _SPLIT_RE.split(markdown.markdown(md_content))
+            segments = []
+            for i in range(0, len(parts), 3):
+                segments.append(html.unescape(parts[i]).strip())
+                if i + 1 < len(parts) and parts[i + 1]:
+                    segments.append(parts[i + 1].strip())
+            return '\n'.join(seg for seg in segments if seg)
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
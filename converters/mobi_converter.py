@@ -1,12 +1,17 @@
 """
 MOBI to text converter.
 """
+from typing import Iterator
 import mobi
 import tempfile
 import os
 from bs4 import BeautifulSoup
+from lxml import etree
 from .base import BaseConverter
 
+# Only these elements are rendered when preserving structure
+_STRUCTURE_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p')
+
 
 class MOBIConverter(BaseConverter):
     """Converter for MOBI documents."""
@@ -23,10 +28,7 @@ class MOBIConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting MOBI {input_path}: {str(e)}")
             return False
@@ -41,6 +43,18 @@ class MOBIConverter(BaseConverter):
         Returns:
             Extracted text
         """
+        return ''.join(self._iter_text(input_path)).strip()
+
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from MOBI as a stream of chunks.
+
+        Args:
+            input_path: Path to MOBI file
+
+        Yields:
+            Chunks of extracted text
+        """
         # Create a temporary directory for extraction
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
@@ -52,36 +66,27 @@ class MOBIConverter(BaseConverter):
 
                 if not os.path.exists(html_file):
                     self.logger.error(f"Failed to extract MOBI content from {input_path}")
-                    return ""
+                    return
 
                 # Read and parse HTML
-                with open(html_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    html_content = f.read()
-
-                soup = BeautifulSoup(html_content, 'html.parser')
-
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-
-                text_parts = []
-
                 if self.preserve_structure:
-                    # Extract structured text
-                    for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p']):
-                        text = element.get_text().strip()
-                        if text:
-                            if element.name.startswith('h'):
-                                level = int(element.name[1])
-                                text_parts.append(f"\n{'#' * level} {text}\n\n")
-                            else:
-                                text_parts.append(f"{text}\n\n")
+                    # Walk the lxml tree directly instead of through bs4 wrappers.
+                    # libxml2 decodes the raw bytes itself, so the file is not
+                    # decoded here; bytes also let an XML encoding declaration through.
+                    with open(html_file, 'rb') as f:
+                        raw = f.read()
+                    parser = etree.HTMLParser(encoding='utf-8')
+                    tree = etree.HTML(raw, parser)
+
+                    # Remove script and style elements, keeping the text that follows them
+                    if tree is not None:
+                        etree.strip_elements(tree, 'script', 'style', with_tail=False)
                 else:
-                    # Simple text extraction
-                    text = soup.get_text(separator='\n', strip=True)
-                    text_parts.append(text)
+                    soup = BeautifulSoup(self._read_text(html_file), 'lxml')
 
-                return ''.join(text_parts).strip()
+                    # Remove script and style elements
+                    for script in soup(["script", "style"]):
+                        script.decompose()
 
             except Exception as e:
                 self.logger.error(f"Error extracting MOBI content: {str(e)}")
@@ -91,9 +96,27 @@ class MOBIConverter(BaseConverter):
                         content = f.read()
                         # Very basic text extraction as fallback
                         text = content.decode('utf-8', errors='ignore')
-                        return text
                 except:
-                    return ""
+                    return
+                yield text
+                return
+
+            if self.preserve_structure:
+                if tree is None:
+                    return
+
+                # Extract structured text
+                for element in tree.iter(*_STRUCTURE_TAGS):
+                    text = ''.join(element.itertext()).strip()
+                    if text:
+                        if element.tag.startswith('h'):
+                            level = int(element.tag[1])
+                            yield f"\n{'#' * level} {text}\n\n"
+                        else:
+                            yield f"{text}\n\n"
+            else:
+                # Simple text extraction
+                yield soup.get_text(separator='\n', strip=True)
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
@@ -1,6 +1,7 @@
 """
 PDF to text converter.
 """
+from typing import Iterator
 from PyPDF2 import PdfReader
 from .base import BaseConverter
 
@@ -20,10 +21,7 @@ class PDFConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting PDF {input_path}: {str(e)}")
             return False
@@ -38,29 +36,36 @@ class PDFConverter(BaseConverter):
         Returns:
             Extracted text
         """
-        text_parts = []
+        return ''.join(self._iter_text(input_path)).strip()
+
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from PDF page by page.
+
+        Args:
+            input_path: Path to PDF file
 
+        Yields:
+            Chunks of extracted text
+        """
         reader = PdfReader(input_path)
 
         for page_num, page in enumerate(reader.pages, 1):
             try:
                 page_text = page.extract_text()
-
-                if page_text:
-                    if self.preserve_structure:
-                        # Add page separator
-                        text_parts.append(f"\n{'='*60}\n")
-                        text_parts.append(f"Page {page_num}\n")
-                        text_parts.append(f"{'='*60}\n\n")
-
-                    text_parts.append(page_text)
-                    text_parts.append("\n\n")
-
             except Exception as e:
                 self.logger.warning(f"Error extracting text from page {page_num}: {str(e)}")
                 continue
 
-        return ''.join(text_parts).strip()
+            if page_text:
+                if self.preserve_structure:
+                    # Add page separator
+                    yield f"\n{'='*60}\n"
+                    yield f"Page {page_num}\n"
+                    yield f"{'='*60}\n\n"
+
+                yield page_text
+                yield "\n\n"
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
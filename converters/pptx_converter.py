@@ -1,6 +1,7 @@
 """
 PPTX to text converter.
 """
+from typing import Iterator
 from pptx import Presentation
 from .base import BaseConverter
 
@@ -20,10 +21,7 @@ class PPTXConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting PPTX {input_path}: {str(e)}")
             return False
@@ -38,26 +36,37 @@ class PPTXConverter(BaseConverter):
         Returns:
             Extracted text
         """
+        return ''.join(self._iter_text(input_path)).strip()
+
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from PPTX as a stream of chunks.
+
+        Args:
+            input_path: Path to PPTX file
+
+        Yields:
+            Chunks of extracted text
+        """
         prs = Presentation(input_path)
-        text_parts = []
 
         for slide_num, slide in enumerate(prs.slides, 1):
             if self.preserve_structure:
-                text_parts.append(f"\n{'='*60}\n")
-                text_parts.append(f"Slide {slide_num}\n")
-                text_parts.append(f"{'='*60}\n\n")
+                yield f"\n{'='*60}\n"
+                yield f"Slide {slide_num}\n"
+                yield f"{'='*60}\n\n"
 
             # Extract text from shapes
             for shape in slide.shapes:
                 if hasattr(shape, "text") and shape.text:
                     text = shape.text.strip()
                     if text:
-                        text_parts.append(f"{text}\n")
+                        yield f"{text}\n"
 
                 # Extract text from tables
                 if shape.has_table:
                     if self.preserve_structure:
-                        text_parts.append("\n[TABLE]\n")
+                        yield "\n[TABLE]\n"
 
                     for row in shape.table.rows:
                         row_text = []
@@ -68,16 +77,14 @@ class PPTXConverter(BaseConverter):
 
                         if row_text:
                             if self.preserve_structure:
-                                text_parts.append(" | ".join(row_text) + "\n")
+                                yield " | ".join(row_text) + "\n"
                             else:
-                                text_parts.append(" ".join(row_text) + "\n")
+                                yield " ".join(row_text) + "\n"
 
                     if self.preserve_structure:
-                        text_parts.append("[/TABLE]\n")
-
-            text_parts.append("\n")
+                        yield "[/TABLE]\n"
 
-        return ''.join(text_parts).strip()
+            yield "\n"
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
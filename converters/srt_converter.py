@@ -2,8 +2,23 @@
 SRT (SubRip) to text converter.
 """
 import re
+from typing import Iterator
 from .base import BaseConverter
 
+# Subtitle blocks are separated by blank lines; each match is one block
+_BLOCK_RE = re.compile(r'(.*?)(?:\n\s*\n|\Z)', re.DOTALL)
+
+# Timestamp range; the spacing around the arrow may not cross a line break
+_TIMESTAMP_RE = re.compile(r'\d{2}:\d{2}:\d{2},\d{3}[^\S\n]*-->[^\S\n]*\d{2}:\d{2}:\d{2},\d{3}')
+
+# Any tag in one pass; group 1 marks <br> line breaks, which become a space
+_SRT_TAGS = re.compile(r'(<br\s*/?>)|<[^<>]+>')
+
+
+def _tag_replacement(match: re.Match) -> str:
+    """Replace a line break tag with a space and drop any other tag."""
+    return ' ' if match.group(1) else ''
+
 
 class SRTConverter(BaseConverter):
     """Converter for SRT (SubRip) subtitle files."""
@@ -20,10 +35,7 @@ class SRTConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting SRT {input_path}: {str(e)}")
             return False
@@ -38,10 +50,22 @@ class SRTConverter(BaseConverter):
         Returns:
             Extracted text
         """
-        with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        return ''.join(self._iter_text(input_path)).strip()
 
-        text_parts = []
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from SRT file as a stream of chunks.
+
+        Args:
+            input_path: Path to SRT file
+
+        Yields:
+            Chunks of extracted text
+        """
+        content = self._read_text(input_path)
+        # A UTF-8 byte order mark would otherwise stick to the first line
+        if content.startswith('\ufeff'):
+            content = content[1:]
 
         # SRT format:
         # 1
@@ -53,52 +77,42 @@ class SRTConverter(BaseConverter):
         # 00:00:02,000 --> 00:00:04,000
         # Next subtitle
 
-        # Split into subtitle blocks
-        blocks = re.split(r'\n\s*\n', content.strip())
+        # Scan the content block by block without materializing a block list
+        for block_match in _BLOCK_RE.finditer(content.strip()):
+            block = block_match.group(1).strip()
 
-        for block in blocks:
-            if not block.strip():
+            # Need at least two lines: a timestamp or number plus text
+            if '\n' not in block:
                 continue
 
-            lines = block.strip().split('\n')
-
-            if len(lines) < 2:
-                continue
-
-            # First line is the subtitle number
-            # Second line is the timestamp
-            # Rest are the subtitle text
-
-            subtitle_num = lines[0].strip()
-            timestamp_pattern = re.compile(r'\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}')
-
-            timestamp_line = None
-            text_start_idx = 1
-
             # Find the timestamp line (usually line 1, but could be line 0 if no number)
-            for i, line in enumerate(lines):
-                if timestamp_pattern.search(line):
-                    timestamp_line = line.strip()
-                    text_start_idx = i + 1
-                    break
-
-            if text_start_idx >= len(lines):
-                continue
-
-            # Get subtitle text (everything after timestamp)
-            subtitle_text = ' '.join(lines[text_start_idx:])
+            timestamp = _TIMESTAMP_RE.search(block)
+            if timestamp:
+                line_start = block.rfind('\n', 0, timestamp.start()) + 1
+                line_end = block.find('\n', timestamp.end())
+                if line_end == -1:
+                    continue
+
+                timestamp_line = block[line_start:line_end].strip()
+                # Everything after the timestamp line
+                body = block[line_end + 1:]
+            else:
+                # No timestamp; treat everything after the first line as text
+                timestamp_line = None
+                body = block[block.index('\n') + 1:]
+
+            # Get subtitle text (lines joined with spaces)
+            subtitle_text = body.replace('\n', ' ')
 
             # Remove HTML/formatting tags
             subtitle_text = self._remove_html_tags(subtitle_text)
 
             if subtitle_text.strip():
                 if self.preserve_structure and timestamp_line:
-                    text_parts.append(f"[{timestamp_line}]\n")
+                    yield f"[{timestamp_line}]\n"
 
-                text_parts.append(subtitle_text.strip())
-                text_parts.append('\n\n')
-
-        return ''.join(text_parts).strip()
+                yield subtitle_text.strip()
+                yield '\n\n'
 
     def _remove_html_tags(self, text: str) -> str:
         """
@@ -110,11 +124,12 @@ class SRTConverter(BaseConverter):
         Returns:
             Clean text
         """
-        # Remove common HTML tags used in SRT files
-        text = re.sub(r'</?[ibu]>', '', text)
-        text = re.sub(r'</?font[^>]*>', '', text)
-        text = re.sub(r'<br\s*/?>', ' ', text)
-        text = re.sub(r'<[^>]+>', '', text)
+        # Most subtitle text carries no tags at all
+        if '<' not in text:
+            return text.strip()
+
+        # Remove HTML tags (<i>, <b>, <u>, <font>, ...); <br> becomes a space
+        text = _SRT_TAGS.sub(_tag_replacement, text)
 
         return text.strip()
 
@@ -2,8 +2,27 @@
 VTT (WebVTT) to text converter.
 """
 import re
+from typing import Iterator
 from .base import BaseConverter
 
+# Every line that matters, found in one pass over the whole file. Group 1 is
+# a cue timestamp line; group 2 is a text line, which excludes blank lines,
+# WEBVTT/NOTE lines and numeric cue identifiers. Neither group includes the
+# line's leading whitespace.
+_VTT_LINE_RE = re.compile(
+    r'^(?:[^\S\n]*(\d{2}:\d{2}:\d{2}\.\d{3}[^\S\n]*-->[^\S\n]*\d{2}:\d{2}:\d{2}\.\d{3}[^\n]*)'
+    r'|(?![^\S\n]*(?:WEBVTT|NOTE|\d+[^\S\n]*$))[^\S\n]*(\S[^\n]*))',
+    re.MULTILINE
+)
+
+# Cue text tags, all stripped in one pass: <v Speaker>, </v>, <c.class>,
+# <c>, </c>, <i>/<b>/<u> and inline <00:00:00.000> timestamps. No two adjacent
+# repeats can match the same characters (v\s[^<>]+ rather than the
+# equivalent v\s+[^<>]+), so an unclosed tag cannot backtrack quadratically.
+_VTT_TAGS = re.compile(
+    r'<(?:v\s[^<>]+|/v|c\.[^<>]+|/?c|/?[ibu]|\d{2}:\d{2}:\d{2}\.\d{3})>'
+)
+
 
 class VTTConverter(BaseConverter):
     """Converter for VTT (Web Video Text Tracks) transcript files."""
@@ -20,10 +39,7 @@ class VTTConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting VTT {input_path}: {str(e)}")
             return False
@@ -38,68 +54,58 @@ class VTTConverter(BaseConverter):
         Returns:
             Extracted text
         """
-        with open(input_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        return ''.join(self._iter_text(input_path)).strip()
 
-        text_parts = []
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from VTT file as a stream of chunks.
 
-        # Split into cue blocks
-        lines = content.split('\n')
+        Args:
+            input_path: Path to VTT file
 
-        # Remove WEBVTT header and metadata
-        in_cue = False
-        timestamp_pattern = re.compile(r'^\d{2}:\d{2}:\d{2}\.\d{3}\s*-->\s*\d{2}:\d{2}:\d{2}\.\d{3}')
-        cue_id_pattern = re.compile(r'^\d+$')
+        Yields:
+            Chunks of extracted text
+        """
+        content = self._read_text(input_path)
+        # A UTF-8 byte order mark would otherwise stick to the first line
+        if content.startswith('\ufeff'):
+            content = content[1:]
 
         current_timestamp = None
         current_text = []
 
-        for line in lines:
-            line = line.strip()
-
-            # Skip WEBVTT header and NOTE sections
-            if line.startswith('WEBVTT') or line.startswith('NOTE'):
-                continue
+        for match in _VTT_LINE_RE.finditer(content):
+            timestamp, line = match.groups()
 
-            # Check if this is a timestamp line
-            if timestamp_pattern.match(line):
+            if timestamp is not None:
                 # If we have accumulated text, save it
                 if current_text and self.preserve_structure:
                     if current_timestamp:
-                        text_parts.append(f"[{current_timestamp}]\n")
-                    text_parts.append(' '.join(current_text))
-                    text_parts.append('\n\n')
-                    current_text = []
+                        yield f"[{current_timestamp}]\n"
+                    yield ' '.join(current_text)
+                    yield '\n\n'
+                    current_text.clear()
                 elif current_text:
-                    text_parts.append(' '.join(current_text))
-                    text_parts.append('\n')
-                    current_text = []
+                    yield ' '.join(current_text)
+                    yield '\n'
+                    current_text.clear()
 
-                current_timestamp = line if self.preserve_structure else None
-                in_cue = True
+                current_timestamp = timestamp.rstrip() if self.preserve_structure else None
                 continue
 
-            # Skip cue identifiers (numbers)
-            if cue_id_pattern.match(line):
-                continue
-
-            # Skip empty lines
-            if not line:
-                continue
-
-            # This is subtitle text - remove VTT formatting tags
-            clean_line = self._remove_vtt_tags(line)
+            # This is subtitle text - remove VTT formatting tags (tag-free
+            # lines are used as they are)
+            line = line.rstrip()
+            clean_line = self._remove_vtt_tags(line) if '<' in line else line
             if clean_line:
                 current_text.append(clean_line)
 
         # Add final accumulated text
         if current_text:
             if self.preserve_structure and current_timestamp:
-                text_parts.append(f"[{current_timestamp}]\n")
-            text_parts.append(' '.join(current_text))
-            text_parts.append('\n')
-
-        return ''.join(text_parts).strip()
+                yield f"[{current_timestamp}]\n"
+            yield ' '.join(current_text)
+            yield '\n'
 
     def _remove_vtt_tags(self, text: str) -> str:
         """
@@ -111,20 +117,11 @@ class VTTConverter(BaseConverter):
         Returns:
             Clean text
         """
-        # Remove <v Speaker> tags
-        text = re.sub(r'<v\s+[^>]+>', '', text)
-        text = re.sub(r'</v>', '', text)
-
-        # Remove <c> class tags
-        text = re.sub(r'<c\.[^>]+>', '', text)
-        text = re.sub(r'<c>', '', text)
-        text = re.sub(r'</c>', '', text)
-
-        # Remove other common tags like <i>, <b>, <u>
-        text = re.sub(r'</?[ibu]>', '', text)
+        # Most cue lines carry no tags at all
+        if '<' not in text:
+            return text.strip()
 
-        # Remove timestamp tags
-        text = re.sub(r'<\d{2}:\d{2}:\d{2}\.\d{3}>', '', text)
+        text = _VTT_TAGS.sub('', text)
 
         return text.strip()
 
@@ -1,6 +1,7 @@
 """
 XLSX to text converter.
 """
+from typing import Iterator
 from openpyxl import load_workbook
 from .base import BaseConverter
 
@@ -20,10 +21,7 @@ class XLSXConverter(BaseConverter):
             True if successful, False otherwise
         """
         try:
-            text = self._extract_text(input_path)
-            if text:
-                return self._write_output(text, output_path)
-            return False
+            return self._write_output(self._iter_text(input_path), output_path)
         except Exception as e:
             self.logger.error(f"Error converting XLSX {input_path}: {str(e)}")
             return False
@@ -38,31 +36,55 @@ class XLSXConverter(BaseConverter):
         Returns:
             Extracted text
         """
-        workbook = load_workbook(input_path, data_only=True)
-        text_parts = []
-
-        for sheet_name in workbook.sheetnames:
-            sheet = workbook[sheet_name]
-
-            if self.preserve_structure:
-                text_parts.append(f"\n{'='*60}\n")
-                text_parts.append(f"Sheet: {sheet_name}\n")
-                text_parts.append(f"{'='*60}\n\n")
-
-            # Get all rows
-            for row in sheet.iter_rows(values_only=True):
-                # Filter out empty cells
-                row_values = [str(cell) if cell is not None else '' for cell in row]
-                # Skip completely empty rows
-                if any(val.strip() for val in row_values):
-                    if self.preserve_structure:
-                        text_parts.append(" | ".join(row_values) + "\n")
-                    else:
-                        text_parts.append(" ".join(row_values) + "\n")
-
-            text_parts.append("\n")
-
-        return ''.join(text_parts).strip()
+        return ''.join(self._iter_text(input_path)).strip()
+
+    def _iter_text(self, input_path: str) -> Iterator[str]:
+        """
+        Extract text from XLSX row by row.
+
+        Args:
+            input_path: Path to XLSX file
+
+        Yields:
+            Chunks of extracted text
+        """
+        # Read-only mode streams rows from the sheet XML instead of
+        # building a Cell object for every cell up front
+        workbook = load_workbook(input_path, read_only=True, data_only=True)
+
+        separator = " | " if self.preserve_structure else " "
+
+        try:
+            for sheet_name in workbook.sheetnames:
+                sheet = workbook[sheet_name]
+
+                if self.preserve_structure:
+                    yield f"\n{'='*60}\n"
+                    yield f"Sheet: {sheet_name}\n"
+                    yield f"{'='*60}\n\n"
+
+                # Read-only sheets trust the stored <dimension> record, which
+                # some exporters leave stale (e.g. "A1"). Ignore it and find
+                # the real width in a first pass, so rows are neither cut off
+                # nor left ragged.
+                sheet.reset_dimensions()
+                width = max((len(row) for row in sheet.iter_rows(values_only=True)), default=0)
+
+                # Get all rows
+                for row in sheet.iter_rows(values_only=True):
+                    # Filter out empty cells
+                    row_values = ['' if cell is None else str(cell) for cell in row]
+                    if len(row_values) < width:
+                        row_values.extend([''] * (width - len(row_values)))
+                    # Skip completely empty rows; the concatenation is blank
+                    # exactly when every cell is
+                    if ''.join(row_values).strip():
+                        yield separator.join(row_values) + "\n"
+
+                yield "\n"
+        finally:
+            # Read-only workbooks keep the zip file open until closed
+            workbook.close()
 
     @classmethod
     def get_supported_extensions(cls) -> list[str]:
@@ -4,11 +4,11 @@ Batch processor for parallel document conversion.
 import os
 import logging
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from tqdm import tqdm
 
 from converters.factory import ConverterFactory
+from core.logger import Logger
 from core.memory_monitor import MemoryMonitor
 
 
@@ -26,6 +26,18 @@ class ConversionResult:
         return f"ConversionResult({self.input_path} -> {status})"
 
 
+def _init_worker(log_file: Optional[str], log_level: str):
+    """
+    Set up logging in a worker process.
+
+    Args:
+        log_file: Path to log file, or None to keep the inherited handlers
+        log_level: Logging level
+    """
+    if log_file:
+        Logger.setup(log_file, log_level)
+
+
 class BatchProcessor:
     """Process multiple documents in parallel."""
 
@@ -37,7 +49,10 @@ class BatchProcessor:
         max_memory_gb: float = 10,
         preserve_structure: bool = True,
         skip_on_error: bool = True,
-        overwrite_existing: bool = False
+        overwrite_existing: bool = False,
+        use_processes: bool = True,
+        log_file: Optional[str] = None,
+        log_level: str = 'INFO'
     ):
         """
         Initialize batch processor.
@@ -45,25 +60,64 @@ class BatchProcessor:
         Args:
             input_folder: Path to input folder
             output_folder: Path to output folder
-            batch_size: Number of documents to process in parallel
+            batch_size: Number of documents to process in parallel (0 uses the CPU count)
             max_memory_gb: Maximum memory usage in GB
             preserve_structure: Whether to preserve document structure
             skip_on_error: Whether to skip failed conversions
             overwrite_existing: Whether to overwrite existing output files
+            use_processes: Whether to convert in worker processes (threads otherwise)
+            log_file: Path to log file for worker processes
+            log_level: Logging level for worker processes
         """
         self.input_folder = Path(input_folder)
         self.output_folder = Path(output_folder)
-        self.batch_size = min(batch_size, 10)  # Cap at 10
+        cpu_count = os.cpu_count() or 4
+        self.batch_size = batch_size if batch_size > 0 else cpu_count
         self.preserve_structure = preserve_structure
         self.skip_on_error = skip_on_error
         self.overwrite_existing = overwrite_existing
+        self.use_processes = use_processes
+        self.log_file = log_file
+        self.log_level = log_level
 
         self.memory_monitor = MemoryMonitor(max_memory_gb)
         self.logger = logging.getLogger('doc_converter')
 
+        if self.batch_size > 2 * cpu_count:
+            self.logger.warning(
+                "batch_size %d is more than twice the CPU count (%d)", self.batch_size, cpu_count
+            )
+
         # Create output folder if it doesn't exist
         self.output_folder.mkdir(parents=True, exist_ok=True)
 
+    def _iter_files(self, root: str) -> Iterator[os.DirEntry]:
+        """
+        Recursively iterate over the files below a folder.
+
+        Uses os.scandir directly so each entry's type comes from the cached
+        directory listing instead of a separate stat call. Symlinked folders
+        are not followed, same as os.walk.
+
+        Args:
+            root: Path to folder
+
+        Yields:
+            Directory entries for regular files
+        """
+        stack = [root]
+        while stack:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError as e:
+                self.logger.warning("Cannot read folder %s: %s", folder, e)
+
     def discover_documents(self) -> List[Tuple[str, str]]:
         """
         Discover all supported documents in input folder.
@@ -74,73 +128,35 @@ class BatchProcessor:
         documents = []
 
         if not self.input_folder.exists():
-            self.logger.error(f"Input folder does not exist: {self.input_folder}")
+            self.logger.error("Input folder does not exist: %s", self.input_folder)
             return documents
 
-        # Walk through all files in input folder
-        for root, dirs, files in os.walk(self.input_folder):
-            for filename in files:
-                input_path = Path(root) / filename
+        # Resolve the supported extensions once rather than per file
+        supported_extensions = frozenset(ConverterFactory.get_supported_extensions())
+        input_folder = self.input_folder
+        output_folder = self.output_folder
 
-                # Check if format is supported
-                if not ConverterFactory.is_supported(str(input_path)):
-                    continue
+        # Walk through all files in input folder
+        for entry in self._iter_files(str(input_folder)):
+            # Check if format is supported
+            if os.path.splitext(entry.name)[1].lower() not in supported_extensions:
+                continue
 
-                # Generate output path
-                relative_path = input_path.relative_to(self.input_folder)
-                output_path = self.output_folder / relative_path.with_suffix('.txt')
+            # Generate output path
+            input_path = entry.path
+            relative_path = Path(input_path).relative_to(input_folder)
+            output_path = output_folder / relative_path.with_suffix('.txt')
 
-                # Skip if output exists and not overwriting
-                if output_path.exists() and not self.overwrite_existing:
-                    self.logger.info(f"Skipping existing file: {output_path}")
-                    continue
+            # Skip if output exists and not overwriting
+            if not self.overwrite_existing and os.path.lexists(output_path):
+                self.logger.info("Skipping existing file: %s", output_path)
+                continue
 
-                documents.append((str(input_path), str(output_path)))
+            documents.append((input_path, str(output_path)))
 
-        self.logger.info(f"Discovered {len(documents)} documents to convert")
+        self.logger.info("Discovered %d documents to convert", len(documents))
         return documents
 
-    def _convert_single(self, input_path: str, output_path: str) -> ConversionResult:
-        """
-        Convert a single document.
-
-        Args:
-            input_path: Path to input document
-            output_path: Path to output text file
-
-        Returns:
-            ConversionResult
-        """
-        try:
-            # Get appropriate converter
-            converter = ConverterFactory.get_converter(
-                input_path,
-                preserve_structure=self.preserve_structure
-            )
-
-            if not converter:
-                error = f"No converter found for {input_path}"
-                self.logger.error(error)
-                return ConversionResult(input_path, output_path, False, error)
-
-            # Create output directory if needed
-            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-            # Convert document
-            success, error = converter.safe_convert(input_path, output_path)
-
-            if success:
-                self.logger.info(f"Successfully converted: {input_path}")
-                return ConversionResult(input_path, output_path, True)
-            else:
-                self.logger.error(f"Failed to convert {input_path}: {error}")
-                return ConversionResult(input_path, output_path, False, error)
-
-        except Exception as e:
-            error = f"{type(e).__name__}: {str(e)}"
-            self.logger.error(f"Exception converting {input_path}: {error}")
-            return ConversionResult(input_path, output_path, False, error)
-
     def process_batch(self, documents: List[Tuple[str, str]]) -> List[ConversionResult]:
         """
         Process a batch of documents in parallel.
@@ -159,28 +175,34 @@ class BatchProcessor:
         # Log memory status before processing
         self.memory_monitor.log_memory_status()
 
-        # Process documents in parallel with progress bar
-        with ThreadPoolExecutor(max_workers=self.batch_size) as executor:
-            # Submit all tasks
-            future_to_doc = {
-                executor.submit(self._convert_single, inp, out): (inp, out)
-                for inp, out in documents
-            }
-
-            # Process completed tasks with progress bar
-            with tqdm(total=len(documents), desc="Converting documents", unit="doc") as pbar:
-                for future in as_completed(future_to_doc):
-                    result = future.result()
-                    results.append(result)
-                    pbar.update(1)
-
-                    # Update progress bar description with status
-                    success_count = sum(1 for r in results if r.success)
-                    failed_count = len(results) - success_count
-                    pbar.set_postfix({
-                        'Success': success_count,
-                        'Failed': failed_count
-                    })
+        # Convert in parallel; logging is set up in each worker process
+        converted = ConverterFactory.convert_many(
+            documents,
+            self.batch_size,
+            preserve_structure=self.preserve_structure,
+            use_processes=self.use_processes,
+            initializer=_init_worker,
+            initargs=(self.log_file, self.log_level)
+        )
+
+        # Collect results with progress bar
+        success_count = failed_count = 0
+        with tqdm(total=len(documents), desc="Converting documents", unit="doc") as pbar:
+            for (input_path, output_path), (success, error) in zip(documents, converted):
+                results.append(ConversionResult(input_path, output_path, success, error))
+                pbar.update(1)
+
+                # Update progress bar description with status
+                if success:
+                    success_count += 1
+                    self.logger.info("Successfully converted: %s", input_path)
+                else:
+                    failed_count += 1
+                    self.logger.error("Failed to convert %s: %s", input_path, error)
+                pbar.set_postfix({
+                    'Success': success_count,
+                    'Failed': failed_count
+                })
 
         # Log memory status after processing
         self.memory_monitor.log_memory_status()
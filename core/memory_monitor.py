@@ -1,10 +1,17 @@
 """
 Memory monitoring for the document converter.
 """
+import os
 import psutil
 from typing import Optional
 import logging
 
+# On Linux the resident set size can be read straight from procfs, which is
+# much cheaper than going through psutil
+_STATM_PATH = '/proc/self/statm'
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 0
+_HAS_STATM = _PAGE_SIZE > 0 and os.path.exists(_STATM_PATH)
+
 
 class MemoryMonitor:
     """Monitor system memory usage."""
@@ -18,6 +25,7 @@ class MemoryMonitor:
         """
         self.max_memory_bytes = max_memory_gb * 1024 * 1024 * 1024
         self.logger = logging.getLogger('doc_converter')
+        self._process = psutil.Process()
 
     def get_current_usage(self) -> float:
         """
@@ -26,8 +34,13 @@ class MemoryMonitor:
         Returns:
             Current memory usage in bytes
         """
-        process = psutil.Process()
-        return process.memory_info().rss
+        if _HAS_STATM:
+            try:
+                with open(_STATM_PATH, 'rb') as f:
+                    return int(f.read().split()[1]) * _PAGE_SIZE
+            except (OSError, IndexError, ValueError):
+                pass
+        return self._process.memory_info().rss
 
     def get_current_usage_gb(self) -> float:
         """
@@ -68,8 +81,7 @@ class MemoryMonitor:
             Dictionary with memory stats
         """
         vm = psutil.virtual_memory()
-        process = psutil.Process()
-        process_mem = process.memory_info().rss
+        process_mem = self.get_current_usage()
 
         return {
             'total_gb': vm.total / (1024**3),
@@ -81,9 +93,12 @@ class MemoryMonitor:
 
     def log_memory_status(self):
         """Log current memory status."""
+        # Skip the memory queries entirely when INFO is not being logged
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         info = self.get_system_memory_info()
         self.logger.info(
-            f"Memory Status - Process: {info['process_gb']:.2f}GB, "
-            f"System: {info['used_gb']:.2f}GB / {info['total_gb']:.2f}GB "
-            f"({info['percent']:.1f}%)"
+            "Memory Status - Process: %.2fGB, System: %.2fGB / %.2fGB (%.1f%%)",
+            info['process_gb'], info['used_gb'], info['total_gb'], info['percent']
         )
@@ -60,7 +60,7 @@ Supported formats: PDF, DOCX, XLSX, PPTX, HTML, Markdown, EPUB, MOBI, VTT, SRT
     parser.add_argument(
         '--batch-size',
         type=int,
-        help='Number of documents to process in parallel (1-10, overrides config)'
+        help='Number of documents to process in parallel (0 uses the CPU count, overrides config)'
     )
 
     parser.add_argument(
@@ -136,30 +136,44 @@ def main():
 
         # Override config with command-line arguments
         if args.input:
-            config.config_data['input_folder'] = args.input
+            config.set('input_folder', args.input)
         if args.output:
-            config.config_data['output_folder'] = args.output
-        if args.batch_size:
-            config.config_data['batch_size'] = args.batch_size
+            config.set('output_folder', args.output)
+        if args.batch_size is not None:
+            config.set('batch_size', args.batch_size)
         if args.max_memory:
-            config.config_data['max_memory_gb'] = args.max_memory
+            config.set('max_memory_gb', args.max_memory)
         if args.log_level:
-            config.config_data['log_level'] = args.log_level
+            config.set('log_level', args.log_level)
         if args.no_structure:
-            config.config_data['preserve_structure'] = False
+            config.set('preserve_structure', False)
         if args.overwrite:
-            config.config_data['overwrite_existing'] = True
+            config.set('overwrite_existing', True)
 
         # Set up logging
         logger = Logger.setup(config.log_file, config.log_level)
 
+        # Create batch processor
+        processor = BatchProcessor(
+            input_folder=config.input_folder,
+            output_folder=config.output_folder,
+            batch_size=config.batch_size,
+            max_memory_gb=config.max_memory_gb,
+            preserve_structure=config.preserve_structure,
+            skip_on_error=config.skip_on_error,
+            overwrite_existing=config.overwrite_existing,
+            use_processes=config.use_processes,
+            log_file=config.log_file,
+            log_level=config.log_level
+        )
+
         # Print banner
         print("\n" + "="*60)
         print("DOCUMENT TO TEXT CONVERTER")
         print("="*60)
         print(f"Input folder:  {config.input_folder}")
         print(f"Output folder: {config.output_folder}")
-        print(f"Batch size:    {config.batch_size}")
+        print(f"Batch size:    {processor.batch_size}")
         print(f"Max memory:    {config.max_memory_gb} GB")
         print(f"Preserve structure: {config.preserve_structure}")
         print("="*60 + "\n")
@@ -167,17 +181,6 @@ def main():
         logger.info("Starting document conversion process")
         logger.info(f"Configuration: {config}")
 
-        # Create batch processor
-        processor = BatchProcessor(
-            input_folder=config.input_folder,
-            output_folder=config.output_folder,
-            batch_size=config.batch_size,
-            max_memory_gb=config.max_memory_gb,
-            preserve_structure=config.preserve_structure,
-            skip_on_error=config.skip_on_error,
-            overwrite_existing=config.overwrite_existing
-        )
-
         # Process all documents
         results = processor.process_all()
 
@@ -0,0 +1,76 @@
+"""
+Tests for the shared BaseConverter output handling.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from converters.base import BaseConverter
+from converters.srt_converter import SRTConverter
+
+
+class TestStripChunks(unittest.TestCase):
+    """Tests for BaseConverter._strip_chunks."""
+
+    CASES = [
+        [],
+        [''],
+        ['', '  ', '\n'],
+        ['text'],
+        ['  text  '],
+        ['\n\n', 'a', ' ', '', 'b', '\n'],
+        ['a', '  ', '\t'],
+        ['  a\n', '\n', ' b ', '\n\n'],
+        [' ', 'a b', ' ', ' ', 'c', ''],
+        ['a\n\n', '', '\n', 'b'],
+        ['\u3000x\u3000', '\xa0'],
+    ]
+
+    def test_matches_join_and_strip(self):
+        for chunks in self.CASES:
+            with self.subTest(chunks=chunks):
+                self.assertEqual(''.join(BaseConverter._strip_chunks(chunks)), ''.join(chunks).strip())
+
+    def test_yields_no_empty_chunks(self):
+        for chunks in self.CASES:
+            with self.subTest(chunks=chunks):
+                self.assertNotIn('', list(BaseConverter._strip_chunks(chunks)))
+
+
+class TestWriteOutput(unittest.TestCase):
+    """Tests for BaseConverter._write_output."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.input_path = os.path.join(self.temp_dir.name, 'input.srt')
+        with open(self.input_path, 'w', encoding='utf-8') as f:
+            f.write("1\n00:00:01,000 --> 00:00:02,000\nHello\n")
+
+    def test_empty_stream_writes_no_file(self):
+        output_path = os.path.join(self.temp_dir.name, 'out', 'empty.txt')
+        self.assertFalse(SRTConverter()._write_output(iter([' ', '\n', '']), output_path))
+        self.assertFalse(os.path.exists(os.path.dirname(output_path)))
+
+    def test_whitespace_only_document_writes_no_file(self):
+        with open(self.input_path, 'w', encoding='utf-8') as f:
+            f.write("\n\n  \n")
+        output_path = os.path.join(self.temp_dir.name, 'blank.txt')
+        self.assertEqual(SRTConverter().safe_convert(self.input_path, output_path), (False, "Conversion failed"))
+        self.assertFalse(os.path.exists(output_path))
+
+    def test_removed_output_folder_is_recreated(self):
+        converter = SRTConverter()
+        output_dir = os.path.join(self.temp_dir.name, 'out', 'nested')
+
+        self.assertEqual(converter.safe_convert(self.input_path, os.path.join(output_dir, 'a.txt')), (True, None))
+        shutil.rmtree(os.path.join(self.temp_dir.name, 'out'))
+
+        output_path = os.path.join(output_dir, 'b.txt')
+        self.assertEqual(converter.safe_convert(self.input_path, output_path), (True, None))
+        self.assertTrue(os.path.isfile(output_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
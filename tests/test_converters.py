@@ -0,0 +1,59 @@
+"""
+Tests comparing converter output against the sample documents.
+"""
+import os
+import tempfile
+import unittest
+
+from converters.html_converter import HTMLConverter
+from converters.markdown_converter import MarkdownConverter
+from converters.srt_converter import SRTConverter
+from converters.vtt_converter import VTTConverter
+
+TEST_DOCUMENTS = os.path.join(os.path.dirname(__file__), 'test_documents')
+EXPECTED = os.path.join(TEST_DOCUMENTS, 'expected')
+
+SAMPLES = [
+    (HTMLConverter, 'sample.html'),
+    (MarkdownConverter, 'sample.md'),
+    (SRTConverter, 'sample.srt'),
+    (VTTConverter, 'sample.vtt'),
+]
+
+
+def _read(path: str) -> str:
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+class TestSampleDocuments(unittest.TestCase):
+    """Converting each sample document must reproduce its expected output."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _check(self, preserve_structure: bool):
+        mode = 'structured' if preserve_structure else 'plain'
+        for converter_class, name in SAMPLES:
+            with self.subTest(document=name, mode=mode):
+                input_path = os.path.join(TEST_DOCUMENTS, name)
+                expected_name = f"{name.replace('.', '_')}_{mode}.txt"
+                expected = _read(os.path.join(EXPECTED, expected_name))
+                converter = converter_class(preserve_structure=preserve_structure)
+
+                self.assertEqual(converter._extract_text(input_path), expected)
+
+                output_path = os.path.join(self.temp_dir.name, expected_name)
+                self.assertEqual(converter.safe_convert(input_path, output_path), (True, None))
+                self.assertEqual(_read(output_path), expected)
+
+    def test_structured(self):
+        self._check(preserve_structure=True)
+
+    def test_plain(self):
+        self._check(preserve_structure=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+Tests for the Markdown converter.
+"""
+import os
+import tempfile
+import unittest
+
+from converters.markdown_converter import MarkdownConverter
+
+
+class TestMarkdownPlainText(unittest.TestCase):
+    """Tests for MarkdownConverter with preserve_structure disabled."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.converter = MarkdownConverter(preserve_structure=False)
+
+    def _extract(self, md_content: str) -> str:
+        path = os.path.join(self.temp_dir.name, 'input.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(md_content)
+        return self.converter._extract_text(path)
+
+    def test_quoted_attribute_with_gt(self):
+        self.assertEqual(self._extract('<div title="a>b">raw html</div>'), 'raw html')
+        self.assertEqual(self._extract("<div data-x='>'>y</div>"), 'y')
+
+    def test_script_style_template_dropped(self):
+        text = self._extract(
+            'x\n\n<script type="a>b">bad()</script>\n\n'
+            '<style>p {}</style>\n\n<template><p>hidden</p></template>\n\ny'
+        )
+        self.assertEqual(text, 'x\ny')
+
+    def test_cdata_kept(self):
+        self.assertEqual(self._extract('<div><![CDATA[ cd &amp; x ]]></div>\n\nafter'), 'cd &amp; x\nafter')
+
+    def test_lt_without_tag_name_is_text(self):
+        self.assertEqual(self._extract('<div>1 <2 and 3> 4</div>'), '1 <2 and 3> 4')
+
+
+if __name__ == '__main__':
+    unittest.main()
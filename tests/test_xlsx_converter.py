@@ -0,0 +1,64 @@
+"""
+Tests for the XLSX converter.
+"""
+import os
+import re
+import tempfile
+import unittest
+import zipfile
+
+from openpyxl import Workbook
+
+from converters.xlsx_converter import XLSXConverter
+
+
+def _save_with_stale_dimension(workbook: Workbook, path: str):
+    """
+    Save a workbook with every sheet's <dimension> record rewritten to "A1".
+
+    Args:
+        workbook: Workbook to save
+        path: Path to output XLSX file
+    """
+    clean_path = path + '.clean'
+    workbook.save(clean_path)
+    with zipfile.ZipFile(clean_path) as src, zipfile.ZipFile(path, 'w') as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename.startswith('xl/worksheets/sheet'):
+                data = re.sub(rb'<dimension ref="[^"]*"/>', b'<dimension ref="A1"/>', data)
+            dst.writestr(item, data)
+    os.remove(clean_path)
+
+
+class TestXLSXConverter(unittest.TestCase):
+    """Tests for XLSXConverter."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = 'Data'
+        sheet.append(['r0', 'h2', 'h3'])
+        sheet.append(['r1'])
+        sheet.append([None, None, None])
+        sheet.append(['r3', None, 3.5, 'wide'])
+        workbook.create_sheet('Empty')
+
+        self.path = os.path.join(self.temp_dir.name, 'stale.xlsx')
+        _save_with_stale_dimension(workbook, self.path)
+
+    def test_stale_dimension_keeps_all_rows_and_columns(self):
+        text = XLSXConverter(preserve_structure=False)._extract_text(self.path)
+        self.assertEqual(text, 'r0 h2 h3 \nr1   \nr3  3.5 wide')
+
+    def test_stale_dimension_structured(self):
+        text = XLSXConverter(preserve_structure=True)._extract_text(self.path)
+        self.assertIn('r0 | h2 | h3 | \nr1 |  |  | \nr3 |  | 3.5 | wide\n', text)
+        self.assertIn('Sheet: Empty', text)
+
+
+if __name__ == '__main__':
+    unittest.main()